@@ -130,6 +130,20 @@ def test_remove_punctuation(text, expected):
     assert core.remove_punctuation(text) == expected
 
 
+@pytest.mark.parametrize(
+    ("text", "exclude_punctuation", "expected"),
+    [
+        ("It's a well-known fact!", ["-", "'"], "It's a well-known fact"),
+        ("It's a well-known fact!", None, "Its a wellknown fact"),
+        ("It's a well-known fact!", [], "Its a wellknown fact"),
+    ],
+)
+def test_remove_sentence_punctuation(text, exclude_punctuation, expected):
+    assert core.remove_sentence_punctuation(text, exclude_punctuation) == expected
+    # call twice to exercise the cached translate table
+    assert core.remove_sentence_punctuation(text, exclude_punctuation) == expected
+
+
 @pytest.mark.parametrize(
     ("text", "expected"),
     [
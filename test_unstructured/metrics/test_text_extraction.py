@@ -99,6 +99,95 @@ def test_calculate_edit_distance():
     )
 
 
+@pytest.mark.parametrize(
+    ("output_text", "source_text", "expected_score", "expected_distance"),
+    [
+        ("I like pizza.", "I like pizza.", 1.0, 0),
+        ("", "", 1.0, 0),
+        (None, None, 1.0, 0),
+        ("", "I like pizza.", 0.0, 26),
+        ("I like pizza.", "", 0.0, 13),
+        (None, "I like pizza.", 0.0, 26),
+    ],
+)
+def test_calculate_edit_distance_trivial_inputs(
+    output_text, source_text, expected_score, expected_distance
+):
+    score = text_extraction.calculate_edit_distance(output_text, source_text, return_as="score")
+    distance = text_extraction.calculate_edit_distance(
+        output_text, source_text, return_as="distance"
+    )
+
+    assert score == expected_score
+    assert distance == expected_distance
+
+
+@pytest.mark.parametrize(
+    ("weights", "expected_distance"),
+    [
+        ((2, 1, 1), 7),
+        ((1, 1, 1), 6),
+        (None, 6),
+    ],
+)
+def test_calculate_edit_distance_weights(weights, expected_distance):
+    distance = text_extraction.calculate_edit_distance(
+        "I like pizza.", "I like bagels.", weights=weights
+    )
+
+    assert distance == expected_distance
+
+
+@pytest.mark.parametrize("return_as", ["score", "distance"])
+@pytest.mark.parametrize("weights", [(2, 1, 1), None])
+def test_calculate_edit_distances_matches_calculate_edit_distance(return_as, weights):
+    source_cct = "I like pizza. I like bagels."
+    outputs = [
+        source_cct,
+        "I like p i z z a . I like bagles.",
+        source_cct.replace(" ", ""),
+        "I like pizza.",
+        "",
+        None,
+        "I like pizza pizza. I like bagels.",
+    ]
+    sources = [source_cct] * (len(outputs) - 1) + [""]
+
+    results = text_extraction.calculate_edit_distances(
+        outputs, sources, weights=weights, return_as=return_as
+    )
+
+    assert results == pytest.approx(
+        [
+            text_extraction.calculate_edit_distance(
+                output, source, weights=weights, return_as=return_as
+            )
+            for output, source in zip(outputs, sources)
+        ]
+    )
+
+
+@pytest.mark.parametrize("weights", [(2, 1, 1), None])
+def test_edit_distance_scorer_matches_calculate_edit_distance(weights):
+    source_cct = "I like pizza. I like bagels."
+    outputs = [source_cct, "I like p i z z a . I like bagles.", "I like pizza.", "", None]
+
+    scorer = text_extraction.EditDistanceScorer(source_cct, weights=weights)
+
+    for output in outputs:
+        assert scorer.score(output) == text_extraction.calculate_edit_distance(
+            output, source_cct, weights=weights, return_as="score"
+        )
+        assert scorer.distance(output) == text_extraction.calculate_edit_distance(
+            output, source_cct, weights=weights, return_as="distance"
+        )
+
+
+def test_calculate_edit_distances_raises_on_length_mismatch():
+    with pytest.raises(ValueError):
+        text_extraction.calculate_edit_distances(["a", "b"], ["a"])
+
+
 @pytest.mark.parametrize(
     ("filename", "expected_score", "expected_distance"),
     [
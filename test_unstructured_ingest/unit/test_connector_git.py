@@ -44,6 +44,8 @@ class FakeGitSourceConnectorImpl(GitSourceConnector):
         (Path("Makefile"), ["Makefile"], True),
         (Path("src/my/super/module/main.py"), ["**/*.py"], True),
         (Path("src/my/super/module/main.pyc"), ["**/*.py"], False),
+        (Path("src/my/super/module/main.pyc"), ["**/*.py", "**/*.pyc"], True),
+        (Path("docs/README.md"), ["**/*.py", "*.txt"], False),
     ],
 )
 def test_connector_does_path_match_glob(given_file_path, given_file_glob, then_matches_glob):
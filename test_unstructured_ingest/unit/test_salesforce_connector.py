@@ -1,3 +1,5 @@
+import io
+from collections import OrderedDict
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -5,7 +7,17 @@ import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import dsa, ec, rsa
 
-from unstructured.ingest.connector.salesforce import SalesforceAccessConfig
+from unstructured.ingest.connector.salesforce import (
+    SALESFORCE_QUERY_BATCH_SIZE,
+    SalesforceAccessConfig,
+    SalesforceIngestDoc,
+    SalesforceIngestDocBatch,
+    SalesforceSourceConnector,
+    SimpleSalesforceConfig,
+)
+from unstructured.ingest.interfaces import ProcessorConfig, ReadConfig
+from unstructured.ingest.pipeline.interfaces import PipelineContext
+from unstructured.ingest.pipeline.source import Reader
 
 
 def pkey_to_str(key) -> str:
@@ -55,3 +67,179 @@ def test_private_key_type_fail(mocker):
     with pytest.raises(expected_exception=ValueError):
         config = SalesforceAccessConfig(consumer_key="asdf", private_key=given_nonexistent_path)
         config.get_private_key_value_and_type()
+
+
+def simple_salesforce_config() -> SimpleSalesforceConfig:
+    return SimpleSalesforceConfig(
+        access_config=SalesforceAccessConfig(consumer_key="asdf", private_key="some_path"),
+        categories=["Account"],
+        username="user",
+    )
+
+
+def salesforce_record(record_id: str) -> dict:
+    return {
+        "attributes": {"type": "Account", "url": f"/sobjects/Account/{record_id}"},
+        "Id": record_id,
+        "Name": record_id,
+        "CreatedDate": "2023-06-01T12:00:00.000+0000",
+        "LastModifiedDate": "2023-06-02T12:00:00.000+0000",
+    }
+
+
+def test_get_ingest_docs_batches_record_ids(mocker):
+    record_ids = [f"id{i}" for i in range(SALESFORCE_QUERY_BATCH_SIZE + 1)]
+    mocked_client = MagicMock()
+    mocked_client.query_all_iter.return_value = iter(
+        [{"Id": record_id} for record_id in record_ids]
+    )
+    mocker.patch.object(SimpleSalesforceConfig, "get_client", return_value=mocked_client)
+
+    connector = SalesforceSourceConnector(
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        connector_config=simple_salesforce_config(),
+    )
+
+    ingest_doc_batches = list(connector.get_ingest_docs())
+
+    assert [batch.record_ids for batch in ingest_doc_batches] == [
+        record_ids[:SALESFORCE_QUERY_BATCH_SIZE],
+        record_ids[SALESFORCE_QUERY_BATCH_SIZE:],
+    ]
+    assert all(batch.record_type == "Account" for batch in ingest_doc_batches)
+    mocked_client.query_all.assert_not_called()
+
+
+def test_ingest_doc_batch_downloads_records_with_one_query(mocker, tmp_path):
+    record_ids = ["id0", "id1", "id2"]
+    mocked_client = MagicMock()
+    mocked_client.query_all.return_value = {
+        "records": [salesforce_record(record_id) for record_id in record_ids]
+    }
+    mocker.patch.object(SimpleSalesforceConfig, "get_client", return_value=mocked_client)
+
+    ingest_doc_batch = SalesforceIngestDocBatch(
+        connector_config=simple_salesforce_config(),
+        processor_config=ProcessorConfig(output_dir=str(tmp_path / "output")),
+        read_config=ReadConfig(download_dir=str(tmp_path / "download")),
+        record_type="Account",
+        record_ids=record_ids,
+    )
+    ingest_doc_batch.get_files()
+
+    assert mocked_client.query_all.call_count == 1
+    assert "('id0','id1','id2')" in mocked_client.query_all.call_args.args[0]
+    assert [doc.record_id for doc in ingest_doc_batch.ingest_docs] == record_ids
+    for ingest_doc in ingest_doc_batch.ingest_docs:
+        assert ingest_doc.filename.read_text().startswith("<?xml")
+        assert ingest_doc.date_created == "2023-06-01T12:00:00"
+
+
+def test_ingest_doc_batch_to_dict_excludes_records(mocker, tmp_path):
+    mocked_client = MagicMock()
+    mocked_client.query_all.return_value = {"records": [salesforce_record("id0")]}
+    mocker.patch.object(SimpleSalesforceConfig, "get_client", return_value=mocked_client)
+
+    ingest_doc_batch = SalesforceIngestDocBatch(
+        connector_config=simple_salesforce_config(),
+        processor_config=ProcessorConfig(output_dir=str(tmp_path / "output")),
+        read_config=ReadConfig(download_dir=str(tmp_path / "download")),
+        record_type="Account",
+        record_ids=["id0"],
+    )
+    ingest_doc_batch.get_files()
+    batch_dict = ingest_doc_batch.to_dict()
+
+    assert "_session_handle" not in batch_dict
+    assert "_record" not in batch_dict["ingest_docs"][0]
+    ingest_doc = SalesforceIngestDocBatch.from_dict(batch_dict).ingest_docs[0]
+    assert ingest_doc.date_created == "2023-06-01T12:00:00"
+    assert mocked_client.query_all.call_count == 1
+
+
+def test_xml_for_record():
+    connector_config = simple_salesforce_config()
+    ingest_doc = SalesforceIngestDoc(
+        connector_config=connector_config,
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        record_type="Account",
+        record_id="id0",
+    )
+    record = OrderedDict(
+        [
+            ("attributes", OrderedDict([("type", "Account"), ("url", "/sobjects/Account/id0")])),
+            ("Id", "id0"),
+            ("Name", "Smith & <Sons>"),
+            ("BillingAddress", {"city": "Boston", "geo": {"lat": None}}),
+            ("Phone", None),
+        ]
+    )
+
+    out = io.StringIO()
+    ingest_doc._xml_for_record(record, out)
+
+    assert out.getvalue() == (
+        "<?xml version='1.0' encoding='utf-8'?>\n<root>"
+        "<item>attributes.type: Account</item>"
+        "<item>attributes.url: /sobjects/Account/id0</item>"
+        "<item>Id: id0</item>"
+        "<item>Name: Smith &amp; &lt;Sons&gt;</item>"
+        "<item>BillingAddress.city: Boston</item>"
+        "<item>BillingAddress.geo.lat: None</item>"
+        "<item>Phone: None</item>"
+        "</root>"
+    )
+
+
+def test_ingest_docs_share_session_handle(mocker, tmp_path):
+    mocked_client = MagicMock()
+    mocked_client.query_all.return_value = {"records": [salesforce_record("id0")]}
+    mocked_get_client = mocker.patch.object(
+        SimpleSalesforceConfig, "get_client", return_value=mocked_client
+    )
+    mocker.patch("unstructured.ingest.pipeline.source.session_handle", None)
+
+    read_config = ReadConfig(download_dir=str(tmp_path / "download"), re_download=True)
+    reader = Reader(
+        pipeline_context=PipelineContext(num_processes=1, raise_on_error=True),
+        read_config=read_config,
+    )
+    for _ in range(2):
+        ingest_doc_batch = SalesforceIngestDocBatch(
+            connector_config=simple_salesforce_config(),
+            processor_config=ProcessorConfig(output_dir=str(tmp_path / "output")),
+            read_config=read_config,
+            record_type="Account",
+            record_ids=["id0"],
+        )
+        reader.run(ingest_doc_dict=ingest_doc_batch.to_dict())
+
+    assert mocked_client.query_all.call_count == 2
+    assert mocked_get_client.call_count == 1
+
+
+def test_eml_for_record():
+    ingest_doc = SalesforceIngestDoc(
+        connector_config=simple_salesforce_config(),
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        record_type="EmailMessage",
+        record_id="id0",
+    )
+    email_json = {
+        "MessageDate": "2023-06-01T12:00:00.000+0000",
+        "MessageIdentifier": "<id0@example.com>",
+        "Subject": "Costs {estimate} for $amount",
+        "FromAddress": "from@example.com",
+        "ToAddress": "to@example.com",
+        "TextBody": "Hello,\n  the total is ${total}.",
+        "HtmlBody": "<html><body>Hello,<br />the total is ${total}.</body></html>",
+    }
+
+    eml = ingest_doc._eml_for_record(email_json)
+
+    assert "Subject: Costs {estimate} for $amount\n" in eml
+    assert "\nHello,\n  the total is ${total}.\n" in eml
+    assert "<body><p>Hello,<p>the total is ${total}.</body>" in eml
@@ -1 +1 @@
-__version__ = "0.12.6"  # pragma: no cover
+__version__ = "0.12.7-dev0"  # pragma: no cover
@@ -4,7 +4,8 @@ import quopri
 import re
 import sys
 import unicodedata
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
@@ -304,12 +305,19 @@ def remove_punctuation(s: str) -> str:
     return s
 
 
-def remove_sentence_punctuation(s: str, exclude_punctuation: Optional[list]) -> str:
+@lru_cache(maxsize=8)
+def _punct_table(exclude: Tuple[str, ...]) -> Dict[int, None]:
+    """Returns the punctuation translate table with the characters in `exclude` kept."""
+    if not exclude:
+        return tbl
     tbl_new = tbl.copy()
-    if exclude_punctuation:
-        for punct in exclude_punctuation:
-            del tbl_new[ord(punct)]
-    s = s.translate(tbl_new)
+    for punct in exclude:
+        del tbl_new[ord(punct)]
+    return tbl_new
+
+
+def remove_sentence_punctuation(s: str, exclude_punctuation: Optional[list]) -> str:
+    s = s.translate(_punct_table(tuple(exclude_punctuation or ())))
     return s
 
 
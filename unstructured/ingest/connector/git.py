@@ -1,6 +1,9 @@
 import fnmatch
+import os
+import re
 import typing as t
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 from unstructured.ingest.enhanced_dataclass import enhanced_field
@@ -15,6 +18,24 @@ from unstructured.ingest.interfaces import (
 )
 from unstructured.ingest.logger import logger
 
+SUPPORTED_FILE_EXTENSIONS = frozenset(
+    (
+        ".md",
+        ".txt",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".eml",
+        ".heic",
+        ".html",
+        ".png",
+        ".jpg",
+        ".ppt",
+        ".pptx",
+        ".xml",
+    ),
+)
+
 
 @dataclass
 class GitAccessConfig(AccessConfig):
@@ -37,11 +58,11 @@ class GitIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     connector_config: SimpleGitConfig = field(repr=False)
     path: str
 
-    @property
+    @cached_property
     def filename(self):
         return (Path(self.read_config.download_dir) / self.path).resolve()
 
-    @property
+    @cached_property
     def _output_filename(self):
         return Path(self.processor_config.output_dir) / f"{self.path}.json"
 
@@ -90,35 +111,26 @@ class GitSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
     def is_file_type_supported(path: str) -> bool:
         # Workaround to ensure that auto.partition isn't fed with .yaml, .py, etc. files
         # TODO: What to do with no filenames? e.g. LICENSE, Makefile, etc.
-        supported = path.endswith(
-            (
-                ".md",
-                ".txt",
-                ".pdf",
-                ".doc",
-                ".docx",
-                ".eml",
-                ".heic",
-                ".html",
-                ".png",
-                ".jpg",
-                ".ppt",
-                ".pptx",
-                ".xml",
-            ),
-        )
+        supported = os.path.splitext(path)[1] in SUPPORTED_FILE_EXTENSIONS
         if not supported:
             logger.debug(
                 f"The file {path!r} is discarded as it does not contain a supported filetype.",
             )
         return supported
 
-    def does_path_match_glob(self, path: str) -> bool:
+    @cached_property
+    def file_glob_pattern(self) -> t.Optional[t.Pattern[str]]:
+        """All the file globs compiled into a single regular expression."""
         if not self.connector_config.file_glob:
+            return None
+        return re.compile(
+            "|".join(fnmatch.translate(pattern) for pattern in self.connector_config.file_glob),
+        )
+
+    def does_path_match_glob(self, path: str) -> bool:
+        if self.file_glob_pattern is None:
+            return True
+        if self.file_glob_pattern.match(path):
             return True
-        patterns = self.connector_config.file_glob
-        for pattern in patterns:
-            if fnmatch.filter([path], pattern):
-                return True
         logger.debug(f"The file {path!r} is discarded as it does not match any given glob.")
         return False
@@ -31,7 +31,10 @@ from unstructured.ingest.connector.onedrive import OneDriveIngestDoc
 from unstructured.ingest.connector.opensearch import OpenSearchIngestDoc, OpenSearchIngestDocBatch
 from unstructured.ingest.connector.outlook import OutlookIngestDoc
 from unstructured.ingest.connector.reddit import RedditIngestDoc
-from unstructured.ingest.connector.salesforce import SalesforceIngestDoc
+from unstructured.ingest.connector.salesforce import (
+    SalesforceIngestDoc,
+    SalesforceIngestDocBatch,
+)
 from unstructured.ingest.connector.sharepoint import SharepointIngestDoc
 from unstructured.ingest.connector.slack import SlackIngestDoc
 from unstructured.ingest.connector.wikipedia import (
@@ -71,6 +74,7 @@ INGEST_DOC_NAME_TO_CLASS: Dict[str, Type[EnhancedDataClassJsonMixin]] = {
     "reddit": RedditIngestDoc,
     "s3": S3IngestDoc,
     "salesforce": SalesforceIngestDoc,
+    "salesforce_batch": SalesforceIngestDocBatch,
     "sftp": SftpIngestDoc,
     "sharepoint": SharepointIngestDoc,
     "slack": SlackIngestDoc,
@@ -14,24 +14,31 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from email.utils import formatdate
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from string import Template
-from textwrap import dedent
 
 from unstructured.ingest.enhanced_dataclass import enhanced_field
 from unstructured.ingest.error import SourceConnectionError, SourceConnectionNetworkError
 from unstructured.ingest.interfaces import (
     AccessConfig,
     BaseConnectorConfig,
+    BaseIngestDocBatch,
+    BaseSessionHandle,
     BaseSingleIngestDoc,
     BaseSourceConnector,
+    ConfigSessionHandleMixin,
     IngestDocCleanupMixin,
+    IngestDocSessionHandleMixin,
     SourceConnectorCleanupMixin,
     SourceMetadata,
 )
 from unstructured.ingest.logger import logger
 from unstructured.utils import requires_dependencies
 
+if t.TYPE_CHECKING:
+    from simple_salesforce import Salesforce
+
 
 class MissingCategoryError(Exception):
     """There are no categories with that name."""
@@ -39,25 +46,31 @@ class MissingCategoryError(Exception):
 
 SALESFORCE_API_VERSION = "57.0"
 
+# number of record ids included in a single batched record query
+SALESFORCE_QUERY_BATCH_SIZE = 200
+
 ACCEPTED_CATEGORIES = ["Account", "Case", "Campaign", "EmailMessage", "Lead"]
 
-EMAIL_TEMPLATE = Template(
-    """MIME-Version: 1.0
-Date: $date
-Message-ID: $message_identifier
-Subject: $subject
-From: $from_email
-To: $to_email
+EMAIL_TEMPLATE = """MIME-Version: 1.0
+Date: {date}
+Message-ID: {message_identifier}
+Subject: {subject}
+From: {from_email}
+To: {to_email}
 Content-Type: multipart/alternative; boundary="00000000000095c9b205eff92630"
 --00000000000095c9b205eff92630
 Content-Type: text/plain; charset="UTF-8"
-$textbody
+{textbody}
 --00000000000095c9b205eff92630
 Content-Type: text/html; charset="UTF-8"
-$htmlbody
+{htmlbody}
 --00000000000095c9b205eff92630--
-""",
-)
+"""
+
+
+@dataclass
+class SalesforceSessionHandle(BaseSessionHandle):
+    service: "Salesforce"
 
 
 @dataclass
@@ -83,7 +96,7 @@ class SalesforceAccessConfig(AccessConfig):
 
 
 @dataclass
-class SimpleSalesforceConfig(BaseConnectorConfig):
+class SimpleSalesforceConfig(ConfigSessionHandleMixin, BaseConnectorConfig):
     """Connector specific attributes"""
 
     access_config: SalesforceAccessConfig
@@ -92,7 +105,7 @@ class SimpleSalesforceConfig(BaseConnectorConfig):
     recursive: bool = False
 
     @requires_dependencies(["simple_salesforce"], extras="salesforce")
-    def get_client(self):
+    def get_client(self) -> "Salesforce":
         from simple_salesforce import Salesforce
 
         pkey_value, pkey_type = self.access_config.get_private_key_value_and_type()
@@ -105,9 +118,12 @@ class SimpleSalesforceConfig(BaseConnectorConfig):
             version=SALESFORCE_API_VERSION,
         )
 
+    def create_session_handle(self) -> SalesforceSessionHandle:
+        return SalesforceSessionHandle(service=self.get_client())
+
 
 @dataclass
-class SalesforceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
+class SalesforceIngestDoc(IngestDocSessionHandleMixin, IngestDocCleanupMixin, BaseSingleIngestDoc):
     connector_config: SimpleSalesforceConfig
     record_type: str
     record_id: str
@@ -120,6 +136,13 @@ class SalesforceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             self._record = self.get_record()
         return self._record
 
+    def to_dict(self, **kwargs) -> t.Dict[str, t.Any]:
+        as_dict = super().to_dict(**kwargs)
+        # the record content is only needed to write the download file, keep it out of the
+        # serialized doc so it isn't copied between processes or logged
+        as_dict.pop("_record", None)
+        return as_dict
+
     def get_file_extension(self) -> str:
         if self.record_type == "EmailMessage":
             extension = ".eml"
@@ -135,7 +158,7 @@ class SalesforceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         record_file = self.record_id + self.get_file_extension()
         return Path(self.read_config.download_dir) / self.record_type / record_file
 
-    @property
+    @cached_property
     def _output_filename(self) -> Path:
         record_file = self.record_id + self.get_file_extension() + ".json"
         return Path(self.processor_config.output_dir) / self.record_type / record_file
@@ -143,29 +166,33 @@ class SalesforceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     def _create_full_tmp_dir_path(self):
         self._tmp_download_file().parent.mkdir(parents=True, exist_ok=True)
 
-    def _xml_for_record(self, record: OrderedDict) -> str:
-        """Creates partitionable xml file from a record"""
-        import xml.etree.ElementTree as ET
-
-        def flatten_dict(data, parent, prefix=""):
-            for key, value in data.items():
-                if isinstance(value, OrderedDict):
-                    flatten_dict(value, parent, prefix=f"{prefix}{key}.")
-                else:
-                    item = ET.Element("item")
-                    item.text = f"{prefix}{key}: {value}"
-                    parent.append(item)
-
-        root = ET.Element("root")
-        flatten_dict(record, root)
-        xml_string = ET.tostring(root, encoding="utf-8", xml_declaration=True).decode()
-        return xml_string
+    def _xml_for_record(self, record: OrderedDict, out: t.TextIO) -> None:
+        """Writes a partitionable xml file from a record to `out`, one item at a time so the
+        whole document is never held in memory."""
+        from xml.sax.saxutils import escape
+
+        out.write("<?xml version='1.0' encoding='utf-8'?>\n<root>")
+        # nested records are flattened depth first into `parent.child: value` items,
+        # keeping a stack of the partially consumed items of each level
+        stack = [("", iter(record.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                # nested fields are OrderedDicts from simple_salesforce, but accept any dict
+                if isinstance(value, dict):
+                    stack.append((f"{prefix}{key}.", iter(value.items())))
+                    break
+                out.write(f"<item>{escape(f'{prefix}{key}: {value}')}</item>")
+            else:
+                stack.pop()
+        out.write("</root>")
 
     def _eml_for_record(self, email_json: t.Dict[str, t.Any]) -> str:
+        """Recreates standard expected .eml format using template."""
+        # imported here since only email records need to parse dates
         from dateutil import parser  # type: ignore
 
-        """Recreates standard expected .eml format using template."""
-        eml = EMAIL_TEMPLATE.substitute(
+        eml = EMAIL_TEMPLATE.format(
             date=formatdate(parser.parse(email_json.get("MessageDate")).timestamp()),
             message_identifier=email_json.get("MessageIdentifier"),
             subject=email_json.get("Subject"),
@@ -178,12 +205,13 @@ class SalesforceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             .replace("<br />", "<p>")
             .replace("<body", "<body><p"),
         )
-        return dedent(eml)
+        return eml
 
     @SourceConnectionNetworkError.wrap
     def _get_response(self):
-        client = self.connector_config.get_client()
-        return client.query_all(
+        # the session handle is shared by all the docs handled in the same process, so the
+        # client only authenticates once per process rather than once per record
+        return self.session_handle.service.query_all(
             f"select FIELDS(STANDARD) from {self.record_type} where Id='{self.record_id}'",
         )
 
@@ -225,26 +253,92 @@ class SalesforceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         self.update_source_metadata()
 
         try:
-            if self.record_type == "EmailMessage":
-                document = self._eml_for_record(record)
-            else:
-                document = self._xml_for_record(record)
-
             with open(self._tmp_download_file(), "w") as page_file:
-                page_file.write(document)
+                if self.record_type == "EmailMessage":
+                    page_file.write(self._eml_for_record(record))
+                else:
+                    self._xml_for_record(record, page_file)
 
         except Exception as e:
             logger.error(
                 f"Error while downloading and saving file: {self.record_id}.",
             )
             logger.error(e)
+            # don't leave a partially written file behind, it would be skipped as downloaded
+            self._tmp_download_file().unlink(missing_ok=True)
 
-    @property
+    @cached_property
     def filename(self):
         """The filename of the file created from a Salesforce record"""
         return self._tmp_download_file()
 
 
+@dataclass
+class SalesforceIngestDocBatch(IngestDocSessionHandleMixin, BaseIngestDocBatch):
+    """Downloads the records of a batch of ids with a single query, rather than one query
+    per record."""
+
+    connector_config: SimpleSalesforceConfig
+    ingest_docs: t.List[SalesforceIngestDoc] = field(default_factory=list)
+    record_type: str = ""
+    record_ids: t.List[str] = field(default_factory=list)
+    registry_name: str = "salesforce_batch"
+
+    @property
+    def unique_id(self) -> str:
+        return ",".join(sorted(self.record_ids))
+
+    def to_dict(self, encode_json=False) -> t.Dict[str, t.Any]:
+        as_dict = super().to_dict(encode_json=encode_json)
+        as_dict.pop("_session_handle", None)
+        # serialize the downloaded docs with their own to_dict so their source metadata is kept
+        as_dict["ingest_docs"] = [doc.to_dict(encode_json=encode_json) for doc in self.ingest_docs]
+        return as_dict
+
+    @classmethod
+    def from_dict(cls, kvs, *, infer_missing=False) -> "SalesforceIngestDocBatch":
+        doc_batch = super().from_dict(kvs, infer_missing=infer_missing)
+        doc_batch.ingest_docs = [
+            SalesforceIngestDoc.from_dict(ingest_doc) for ingest_doc in kvs.get("ingest_docs", [])
+        ]
+        return doc_batch
+
+    @SourceConnectionNetworkError.wrap
+    @requires_dependencies(["simple_salesforce"], extras="salesforce")
+    def _get_response(self):
+        from simple_salesforce.format import format_soql
+
+        # record_type is checked against ACCEPTED_CATEGORIES, the ids are quoted by format_soql
+        return self.session_handle.service.query_all(
+            format_soql(
+                f"select FIELDS(STANDARD) from {self.record_type} where Id in {{record_ids}}",
+                record_ids=self.record_ids,
+            ),
+        )
+
+    @SourceConnectionError.wrap
+    def get_files(self):
+        response = self._get_response()
+        logger.debug(
+            f"{len(response['records'])} salesforce {self.record_type} records were returned "
+            f"for {len(self.record_ids)} record ids",
+        )
+        for record in response["records"]:
+            ingest_doc = SalesforceIngestDoc(
+                connector_config=self.connector_config,
+                processor_config=self.processor_config,
+                read_config=self.read_config,
+                record_type=self.record_type,
+                record_id=record["Id"],
+                _record=record,
+            )
+            # get_file is skipped for records that were already downloaded, but the source
+            # metadata is still needed downstream
+            ingest_doc.update_source_metadata()
+            ingest_doc.get_file()
+            self.ingest_docs.append(ingest_doc)
+
+
 @dataclass
 class SalesforceSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
     connector_config: SimpleSalesforceConfig
@@ -266,36 +360,36 @@ class SalesforceSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
             raise SourceConnectionError(f"failed to validate connection: {salesforce_error}")
 
     @requires_dependencies(["simple_salesforce"], extras="salesforce")
-    def get_ingest_docs(self) -> t.List[SalesforceIngestDoc]:
+    def get_ingest_docs(self) -> t.Iterator[SalesforceIngestDocBatch]:
         """Get Salesforce Ids for the records.
-        Send them to next phase where each doc gets downloaded into the
+        Send them to next phase where each batch of ids gets downloaded into the
         appropriate format for partitioning.
+
+        Ids are paged in with `query_all_iter`, but the pipeline still collects every batch
+        doc before downloading, so all ids are held in memory at once; only record contents
+        are deferred to the download step.
         """
         from simple_salesforce.exceptions import SalesforceMalformedRequest
 
         client = self.connector_config.get_client()
 
-        ingest_docs = []
         for record_type in self.connector_config.categories:
             if record_type not in ACCEPTED_CATEGORIES:
                 raise ValueError(f"{record_type} not currently an accepted Salesforce category")
 
             try:
                 # Get ids from Salesforce
-                records = client.query_all(
+                records = client.query_all_iter(
                     f"select Id from {record_type}",
                 )
-                for record in records["records"]:
-                    ingest_docs.append(
-                        SalesforceIngestDoc(
-                            connector_config=self.connector_config,
-                            processor_config=self.processor_config,
-                            read_config=self.read_config,
-                            record_type=record_type,
-                            record_id=record["Id"],
-                        ),
+                record_ids = (record["Id"] for record in records)
+                while batch_ids := list(islice(record_ids, SALESFORCE_QUERY_BATCH_SIZE)):
+                    yield SalesforceIngestDocBatch(
+                        connector_config=self.connector_config,
+                        processor_config=self.processor_config,
+                        read_config=self.read_config,
+                        record_type=record_type,
+                        record_ids=batch_ids,
                     )
             except SalesforceMalformedRequest as e:
                 raise SalesforceMalformedRequest(f"Problem with Salesforce query: {e}")
-
-        return ingest_docs
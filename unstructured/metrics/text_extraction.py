@@ -1,14 +1,17 @@
-from typing import Dict, Optional, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from rapidfuzz.distance import Levenshtein
 
 from unstructured.cleaners.core import clean_bullets, remove_sentence_punctuation
 
+UNIFORM_WEIGHTS = (1, 1, 1)
+
 
 def calculate_accuracy(
     output: Optional[str],
     source: Optional[str],
-    weights: Tuple[int, int, int] = (2, 1, 1),
+    weights: Optional[Tuple[int, int, int]] = (2, 1, 1),
 ) -> float:
     """
     Calculates accuracy by calling calculate_edit_distance function using `return_as=score`.
@@ -20,7 +23,7 @@ def calculate_accuracy(
 def calculate_edit_distance(
     output: Optional[str],
     source: Optional[str],
-    weights: Tuple[int, int, int] = (2, 1, 1),
+    weights: Optional[Tuple[int, int, int]] = (2, 1, 1),
     return_as: str = "distance",
 ) -> float:
     """
@@ -31,7 +34,9 @@ def calculate_edit_distance(
         source (str): The reference string against which 'output' is compared.
         weights (Tuple[int, int, int], optional): A tuple containing weights
             for insertion, deletion, and substitution operations in the edit
-            distance calculation. Default is (2, 1, 1).
+            distance calculation. Default is (2, 1, 1). Passing None (or (1, 1, 1))
+            computes the unweighted distance, which uses rapidfuzz's much faster
+            bit-parallel implementation.
         return_as (str, optional): The type of result to return, one of
             ["score", "distance"].
             Default is "distance".
@@ -58,16 +63,76 @@ def calculate_edit_distance(
         raise ValueError("Invalid return value type. Expected one of: %s" % return_types)
     output = _prepare_str(output)
     source = _prepare_str(source)
-    distance = Levenshtein.distance(output, source, weights=weights)  # type: ignore
-    # lower bounded the char length for source string at 1.0 because to avoid division by zero
-    # in the case where source string is empty, the distance should be at 100%
-    source_char_len = max(len(source), 1.0)  # type: ignore
-    bounded_percentage_distance = min(max(distance / source_char_len, 0.0), 1.0)
+    if weights is None:
+        weights = UNIFORM_WEIGHTS
     if return_as == "score":
-        return 1 - bounded_percentage_distance
-    elif return_as == "distance":
-        return distance
-    return 0.0
+        return _edit_distance_score(output, source, weights)
+    return _levenshtein_distance(output, source, weights)
+
+
+class EditDistanceScorer:
+    """
+    Calculates the edit distance between a single reference `source` string and any number of
+    output strings.
+
+    The source string and weights are bound once, so callers comparing many outputs against the
+    same source don't need to pass them on every call. Each comparison still computes the full
+    edit distance.
+
+    Example:
+        scorer = EditDistanceScorer(source_cct)
+        scores = [scorer.score(output_cct) for output_cct in output_ccts]
+    """
+
+    def __init__(
+        self,
+        source: Optional[str],
+        weights: Optional[Tuple[int, int, int]] = (2, 1, 1),
+    ):
+        self.source = _prepare_str(source)
+        self.weights = UNIFORM_WEIGHTS if weights is None else weights
+
+    def distance(self, output: Optional[str]) -> float:
+        """Returns the raw edit distance between `output` and the source string."""
+        return _levenshtein_distance(_prepare_str(output), self.source, self.weights)
+
+    def score(self, output: Optional[str]) -> float:
+        """Returns the similarity score between `output` and the source string, where 1.0
+        indicates a perfect match."""
+        return _edit_distance_score(_prepare_str(output), self.source, self.weights)
+
+
+def calculate_edit_distances(
+    outputs: Sequence[Optional[str]],
+    sources: Sequence[Optional[str]],
+    weights: Optional[Tuple[int, int, int]] = (2, 1, 1),
+    return_as: str = "distance",
+) -> List[float]:
+    """
+    Calculates the edit distance between each pair of strings in `outputs` and `sources`.
+
+    Equivalent to calling `calculate_edit_distance` on each (output, source) pair, but the
+    arguments are validated once for the whole batch.
+
+    Raises:
+        ValueError: If 'return_as' is not one of the valid return types
+        ["score", "distance"], or if `outputs` and `sources` have different lengths.
+    """
+    return_types = ["score", "distance"]
+    if return_as not in return_types:
+        raise ValueError("Invalid return value type. Expected one of: %s" % return_types)
+    if len(outputs) != len(sources):
+        raise ValueError(
+            f"Expected the same number of outputs and sources, got {len(outputs)} outputs "
+            f"and {len(sources)} sources.",
+        )
+    if weights is None:
+        weights = UNIFORM_WEIGHTS
+    compare = _edit_distance_score if return_as == "score" else _levenshtein_distance
+    return [
+        compare(_prepare_str(output), _prepare_str(source), weights)
+        for output, source in zip(outputs, sources)
+    ]
 
 
 def bag_of_words(text: str) -> Dict[str, int]:
@@ -78,33 +143,23 @@ def bag_of_words(text: str) -> Dict[str, int]:
 
     Removes sentence punctuation, but not punctuation within a word (ex. apostrophes).
     """
-    bow: Dict[str, int] = {}
-    incorrect_word: str = ""
     words = clean_bullets(remove_sentence_punctuation(text.lower(), ["-", "'"])).split()
 
-    i = 0
-    while i < len(words):
-        if len(words[i]) > 1:
-            if words[i] in bow:
-                bow[words[i]] += 1
-            else:
-                bow[words[i]] = 1
-            i += 1
-        else:
-            j = i
-            incorrect_word = ""
-
-            while j < len(words) and len(words[j]) == 1:
-                incorrect_word += words[j]
-                j += 1
-
-            if len(incorrect_word) == 1 and words[i].isalnum():
-                if incorrect_word in bow:
-                    bow[incorrect_word] += 1
-                else:
-                    bow[incorrect_word] = 1
-            i = j
-    return bow
+    bow: List[str] = []
+    # a run of single characters is most likely a spaced-out word (ex. h e l l o), so only
+    # an isolated alphanumeric character is counted as a word
+    single_chars: List[str] = []
+    for word in words:
+        if len(word) == 1:
+            single_chars.append(word)
+            continue
+        if len(single_chars) == 1 and single_chars[0].isalnum():
+            bow.append(single_chars[0])
+        single_chars.clear()
+        bow.append(word)
+    if len(single_chars) == 1 and single_chars[0].isalnum():
+        bow.append(single_chars[0])
+    return dict(Counter(bow))
 
 
 def calculate_percent_missing_text(
@@ -153,6 +208,33 @@ def calculate_percent_missing_text(
     return min(fraction_missing, 1)  # limit to 100%
 
 
+def _levenshtein_distance(
+    output: str,
+    source: str,
+    weights: Tuple[int, int, int],
+    score_cutoff: Optional[int] = None,
+) -> int:
+    if output == source:
+        # identical strings, including two empty strings, need no edits
+        return 0
+    if not output or not source:
+        # the only edits are deleting all of `output` or inserting all of `source`
+        return len(output) * weights[1] + len(source) * weights[0]
+    if weights == UNIFORM_WEIGHTS:
+        return Levenshtein.distance(output, source, score_cutoff=score_cutoff)
+    return Levenshtein.distance(output, source, weights=weights, score_cutoff=score_cutoff)
+
+
+def _edit_distance_score(output: str, source: str, weights: Tuple[int, int, int]) -> float:
+    # any distance above the source length saturates the score at 0.0, so the score only
+    # needs the distance up to that cutoff which lets rapidfuzz exit early
+    distance = _levenshtein_distance(output, source, weights, score_cutoff=len(source))
+    # lower bounded the char length for source string at 1.0 because to avoid division by
+    # zero in the case where source string is empty, the distance should be at 100%
+    source_char_len = max(len(source), 1)
+    return 1 - min(max(distance / source_char_len, 0.0), 1.0)
+
+
 def _prepare_str(string: Optional[str]) -> str:
     if not string:
         return ""